@@ -10,22 +10,31 @@ import json
 import os
 import re
 import logging
-import array
 import asyncio
+import random
 import time
 import hashlib
 from collections import OrderedDict
-from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import AsyncIterable, Any, Protocol
+from typing import AsyncIterable, AsyncIterator, Any, Protocol
 
 import aiohttp
+import numpy as np
 from dotenv import load_dotenv
 try:
     from redis.asyncio import Redis as AsyncRedis
 except Exception:  # pragma: no cover - optional dependency
     AsyncRedis = None
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+try:
+    import re2 as _marker_re  # google-re2: linear-time DFA matching
+except Exception:  # pragma: no cover - optional dependency
+    _marker_re = re
 
 from livekit import agents, rtc
 from livekit.agents import (
@@ -66,14 +75,12 @@ class DebugDeepgramSTT(deepgram.STT):
             n = frame_probe["count"]
             if n <= 10 or n % 200 == 0:
                 try:
-                    pcm = frame.data.tobytes()
-                    samples = array.array("h")
-                    samples.frombytes(pcm)
-                    if samples:
-                        step = max(1, len(samples) // 200)
-                        sampled = samples[::step]
-                        peak = max(abs(v) for v in sampled)
-                        avg = sum(abs(v) for v in sampled) / len(sampled)
+                    samples = np.frombuffer(frame.data, dtype=np.int16)
+                    if samples.size:
+                        # Widen before abs() so -32768 doesn't wrap back to itself.
+                        sampled = np.abs(samples[::max(1, samples.size // 200)].astype(np.int32))
+                        peak = int(sampled.max())
+                        avg = float(sampled.mean())
                         logger.info(
                             f"AudioProbe frame={n} peak={peak} avg={avg:.1f} "
                             f"sr={frame.sample_rate} ch={frame.num_channels}"
@@ -111,7 +118,9 @@ class DebugDeepgramSTT(deepgram.STT):
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("joi-voice")
-VOICE_MARKER_RE = re.compile(r"\[(?:[a-z][a-z0-9_-]{0,20})\]\s*", re.IGNORECASE)
+# Inline (?i) since re2 doesn't take `re` flag constants.
+VOICE_MARKER_RE = _marker_re.compile(r"(?i)\[(?:[a-z][a-z0-9_-]{0,20})\]\s*")
+_BOUNDARY_CHARS = (" ", "\n", "\t", ".", ",", "!", "?", ";", ":", ")", "]", "}")
 
 # ── Config ──
 
@@ -139,6 +148,10 @@ def load_livekit_config() -> dict:
     return lk if isinstance(lk, dict) else {}
 
 
+# Short codes Deepgram needs spelled out; other codes pass through as-is.
+_STT_LANGUAGE_MAP = {"en": "en-US"}
+
+
 def _normalize_language_code(raw: str | None) -> str:
     lang = (raw or "").strip().lower()
     if not lang:
@@ -323,31 +336,88 @@ GATEWAY_URL = os.environ.get("GATEWAY_URL", "http://localhost:3100")
 VOICE_CHAT_MAX_ATTEMPTS = 3
 VOICE_CHAT_CONNECT_TIMEOUT_S = 6
 VOICE_CHAT_READ_TIMEOUT_S = 90
-VOICE_MIN_ENDPOINT_DELAY_S = _cfg_float("voiceMinEndpointSec", "JOI_VOICE_MIN_ENDPOINT_SEC", 0.15, minimum=0.0)
-VOICE_MAX_ENDPOINT_DELAY_S = _cfg_float("voiceMaxEndpointSec", "JOI_VOICE_MAX_ENDPOINT_SEC", 0.8, minimum=0.0)
-TTS_CACHE_ENABLED = _cfg_bool("ttsCacheEnabled", "JOI_TTS_CACHE_ENABLED", True)
-TTS_CACHE_LOCAL_MAX_ITEMS = _cfg_int("ttsCacheLocalMaxItems", "JOI_TTS_CACHE_LOCAL_MAX_ITEMS", 512, minimum=0)
-TTS_CACHE_LOCAL_MAX_BYTES = _cfg_int(
-    "ttsCacheLocalMaxBytes",
-    "JOI_TTS_CACHE_LOCAL_MAX_BYTES",
-    64 * 1024 * 1024,
-    minimum=1 * 1024 * 1024,
-)
-TTS_CACHE_MAX_TEXT_CHARS = _cfg_int("ttsCacheMaxTextChars", "JOI_TTS_CACHE_MAX_TEXT_CHARS", 280, minimum=32)
-TTS_CACHE_MAX_AUDIO_BYTES = _cfg_int(
-    "ttsCacheMaxAudioBytes",
-    "JOI_TTS_CACHE_MAX_AUDIO_BYTES",
-    2 * 1024 * 1024,
-    minimum=16384,
-)
-TTS_CACHE_REDIS_TTL_SEC = _cfg_int(
-    "ttsCacheRedisTtlSec",
-    "JOI_TTS_CACHE_REDIS_TTL_SEC",
-    604800,
-    minimum=60,
+VOICE_CHAT_RETRY_BASE_S = 0.3
+VOICE_CHAT_RETRY_MAX_S = 5.0
+VOICE_CHAT_RETRY_JITTER = 0.5
+# Give up retrying once this much wall time has passed since the turn started.
+VOICE_CHAT_RETRY_DEADLINE_S = 10.0
+# Finished turns awaiting their TTS cache metrics report.
+PENDING_TURNS_MAX = 8
+# Usage events waiting to be posted; the oldest is dropped beyond this.
+VOICE_USAGE_QUEUE_MAX = 256
+# How long shutdown waits for queued usage events to be posted.
+VOICE_USAGE_DRAIN_TIMEOUT_S = 2.0
+# Coalesce streamed text before handing it to TTS: the first piece goes out
+# immediately, later ones once this many chars, a punctuation mark, or this
+# much time since the last flush has accumulated.
+VOICE_TTS_COALESCE_CHARS = 40
+VOICE_TTS_COALESCE_S = 0.03
+_TTS_FLUSH_CHARS = frozenset(".!?,;:")
+_TEL_TIMEOUT = aiohttp.ClientTimeout(total=1.0, sock_connect=0.4, sock_read=0.6)
+_SSE_TIMEOUT = aiohttp.ClientTimeout(
+    total=None,
+    sock_connect=VOICE_CHAT_CONNECT_TIMEOUT_S,
+    sock_read=VOICE_CHAT_READ_TIMEOUT_S,
 )
-TTS_CACHE_PREFIX = _cfg_str("ttsCachePrefix", "JOI_TTS_CACHE_PREFIX", "joi:tts:v1")
-TTS_CACHE_REDIS_URL = _cfg_str("ttsCacheRedisUrl", "JOI_TTS_CACHE_REDIS_URL", "")
+
+
+@dataclass(frozen=True, slots=True)
+class VoiceConfig:
+    min_endpoint_delay_s: float
+    max_endpoint_delay_s: float
+    tts_cache_enabled: bool
+    tts_cache_local_max_items: int
+    tts_cache_local_max_bytes: int
+    tts_cache_max_text_chars: int
+    tts_cache_max_audio_bytes: int
+    tts_cache_redis_ttl_sec: int
+    tts_cache_prefix: str
+    tts_cache_redis_url: str
+
+
+def load_voice_config() -> VoiceConfig:
+    """Resolve worker tunables once at import: ~/.joi/config.json, then env, then defaults."""
+    return VoiceConfig(
+        min_endpoint_delay_s=_cfg_float("voiceMinEndpointSec", "JOI_VOICE_MIN_ENDPOINT_SEC", 0.15, minimum=0.0),
+        max_endpoint_delay_s=_cfg_float("voiceMaxEndpointSec", "JOI_VOICE_MAX_ENDPOINT_SEC", 0.8, minimum=0.0),
+        tts_cache_enabled=_cfg_bool("ttsCacheEnabled", "JOI_TTS_CACHE_ENABLED", True),
+        tts_cache_local_max_items=_cfg_int(
+            "ttsCacheLocalMaxItems", "JOI_TTS_CACHE_LOCAL_MAX_ITEMS", 512, minimum=0
+        ),
+        tts_cache_local_max_bytes=_cfg_int(
+            "ttsCacheLocalMaxBytes",
+            "JOI_TTS_CACHE_LOCAL_MAX_BYTES",
+            64 * 1024 * 1024,
+            minimum=1 * 1024 * 1024,
+        ),
+        tts_cache_max_text_chars=_cfg_int(
+            "ttsCacheMaxTextChars", "JOI_TTS_CACHE_MAX_TEXT_CHARS", 280, minimum=32
+        ),
+        tts_cache_max_audio_bytes=_cfg_int(
+            "ttsCacheMaxAudioBytes",
+            "JOI_TTS_CACHE_MAX_AUDIO_BYTES",
+            2 * 1024 * 1024,
+            minimum=16384,
+        ),
+        tts_cache_redis_ttl_sec=_cfg_int(
+            "ttsCacheRedisTtlSec",
+            "JOI_TTS_CACHE_REDIS_TTL_SEC",
+            604800,
+            minimum=60,
+        ),
+        tts_cache_prefix=_cfg_str("ttsCachePrefix", "JOI_TTS_CACHE_PREFIX", "joi:tts:v1"),
+        tts_cache_redis_url=_cfg_str("ttsCacheRedisUrl", "JOI_TTS_CACHE_REDIS_URL", ""),
+    )
+
+
+VOICE_CONFIG = load_voice_config()
+
+# Max already-tokenized sentences whose cache lookups are batched into one request.
+TTS_CACHE_LOOKAHEAD_SEGMENTS = 4
+# Max cache lookups in flight per synthesis stream.
+TTS_CACHE_MAX_INFLIGHT_LOOKUPS = 2
+# Max background cache writes in flight per synthesis stream.
+TTS_CACHE_MAX_PENDING_STORES = 4
 
 # ── Pronunciation replacement (ported from joi-agent.ts) ──
 
@@ -356,49 +426,50 @@ def build_pronunciation_replacer(rules: list[dict]):
     if not rules:
         return lambda text: text, lambda: ""
 
-    patterns = []
-    for r in rules:
-        word = re.escape(r["word"])
-        patterns.append((re.compile(rf"\b{word}\b", re.IGNORECASE), r["replacement"]))
+    # One alternation scanned once per flush instead of one regex pass per rule.
+    combined = re.compile(
+        "|".join(rf"(?P<r{i}>\b{re.escape(r['word'])}\b)" for i, r in enumerate(rules)),
+        re.IGNORECASE,
+    )
+    replacements = [r["replacement"] for r in rules]
+
+    def _sub(match: re.Match) -> str:
+        return replacements[int(match.lastgroup[1:])]
 
     buffer = []
 
     def push(delta: str) -> str:
+        # The buffered tail never contains a boundary, so only the new delta
+        # needs scanning.
+        delta_boundary = max(delta.rfind(c) for c in _BOUNDARY_CHARS)
         buffer.append(delta)
-        text = "".join(buffer)
-
-        # Find last word boundary
-        last_boundary = -1
-        for i in range(len(text) - 1, -1, -1):
-            if text[i] in " \n\t.,!?;:)]}":
-                last_boundary = i
-                break
-
-        if last_boundary < 0:
+        if delta_boundary < 0:
             return ""
 
+        text = "".join(buffer)
+        last_boundary = len(text) - len(delta) + delta_boundary
+
         to_flush = text[:last_boundary + 1]
         buffer.clear()
         buffer.append(text[last_boundary + 1:])
 
-        for pattern, replacement in patterns:
-            to_flush = pattern.sub(replacement, to_flush)
-        return to_flush
+        return combined.sub(_sub, to_flush)
 
     def flush() -> str:
         if not buffer:
             return ""
         text = "".join(buffer)
         buffer.clear()
-        for pattern, replacement in patterns:
-            text = pattern.sub(replacement, text)
-        return text
+        return combined.sub(_sub, text)
 
     return push, flush
 
 
 def strip_voice_markers(text: str) -> str:
     """Remove bracketed stage/emotion markers (e.g. [happy], [thinking])."""
+    # Markers always open with "["; most stream deltas have none.
+    if "[" not in text:
+        return text
     return VOICE_MARKER_RE.sub("", text)
 
 
@@ -445,19 +516,74 @@ def build_voice_prompt(lk_config: dict) -> str:
 
 # ── TTS cache (local LRU + Redis) ──
 
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+_SSE_STREAM_PREFIX = b'{"type":"stream","delta":"'
+
+
+def _parse_stream_delta(payload: bytes) -> str | None:
+    """Fast path for the gateway's compact `{"type":"stream","delta":"..."}` frames.
+
+    Never builds an event dict: plain deltas are decoded straight from the
+    bytes, escaped ones (newlines, quotes) by parsing just the JSON string.
+    Returns None for any other shape so the caller falls back to a full parse.
+    """
+    if not payload.startswith(_SSE_STREAM_PREFIX):
+        return None
+    raw = payload.rstrip(b"\r")
+    if not raw.endswith(b'"}'):
+        return None
+    raw = raw[len(_SSE_STREAM_PREFIX):-2]
+    if b"\\" in raw:
+        # Only parses if raw is exactly one string body, i.e. the frame
+        # really was {"type":"stream","delta":...} and nothing more.
+        try:
+            return _loads(b'"' + raw + b'"')
+        except ValueError:
+            return None
+    if b'"' in raw:
+        return None
+    return raw.decode("utf-8")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Compact, key-sorted JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    # Same byte layout as orjson so cache keys match across workers.
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_WS_RE = re.compile(r"\s+")
+
+
 def _normalize_cache_text(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    # Most sentence tokens are already single-spaced; skip the regex for them.
+    if "  " not in text and "\n" not in text and "\t" not in text and "\r" not in text:
+        return text.strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
-def _build_tts_cache_key(*, text: str, fingerprint: dict[str, Any]) -> str:
-    payload = {
-        "text": _normalize_cache_text(text),
-        "fp": fingerprint,
-    }
-    digest = hashlib.sha256(
-        json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
-    ).hexdigest()
-    return f"{TTS_CACHE_PREFIX}:{digest}"
+@lru_cache(maxsize=2048)
+def _tts_cache_digest(text_norm: str, fp_json: bytes) -> str:
+    # Short stock phrases ("Sure.", "Okay.") repeat across a session; memoize
+    # so repeats skip re-hashing entirely. Pieces are fed to the hasher as-is,
+    # so no intermediate payload string is built. Keys only need to be unique,
+    # not cryptographic, so a 128-bit BLAKE2b digest is plenty.
+    h = hashlib.blake2b(fp_json, digest_size=16)
+    h.update(b"\0")
+    h.update(text_norm.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _build_tts_cache_key(*, text: str, fp_json: bytes, text_norm: str | None = None) -> str:
+    if text_norm is None:
+        text_norm = _normalize_cache_text(text)
+    digest = _tts_cache_digest(text_norm, fp_json)
+    return f"{VOICE_CONFIG.tts_cache_prefix}:{digest}"
 
 
 @dataclass(slots=True)
@@ -488,15 +614,22 @@ class LocalAudioCache:
         self._items: OrderedDict[str, bytes] = OrderedDict()
         self._lock = asyncio.Lock()
 
-    async def get(self, key: str) -> bytes | None:
+    def get_sync(self, key: str) -> bytes | None:
+        """Lock-free read; safe because nothing awaits between lookup and move_to_end.
+
+        All access happens on the worker's single event loop thread, so only
+        set() (which evicts) needs the lock.
+        """
         if self._max_items <= 0:
             return None
-        async with self._lock:
-            pcm = self._items.get(key)
-            if pcm is None:
-                return None
-            self._items.move_to_end(key)
-            return pcm
+        pcm = self._items.get(key)
+        if pcm is None:
+            return None
+        self._items.move_to_end(key)
+        return pcm
+
+    async def get(self, key: str) -> bytes | None:
+        return self.get_sync(key)
 
     async def set(self, key: str, pcm: bytes) -> None:
         if self._max_items <= 0:
@@ -504,13 +637,13 @@ class LocalAudioCache:
         if len(pcm) > self._max_bytes:
             return
         async with self._lock:
-            old = self._items.get(key)
+            # Pop-then-insert lands the entry at the MRU end without move_to_end.
+            old = self._items.pop(key, None)
             if old is not None:
                 self._current_bytes -= len(old)
 
             self._items[key] = pcm
             self._current_bytes += len(pcm)
-            self._items.move_to_end(key)
             while len(self._items) > self._max_items or self._current_bytes > self._max_bytes:
                 _, evicted = self._items.popitem(last=False)
                 self._current_bytes -= len(evicted)
@@ -526,6 +659,9 @@ class RemoteAudioCache(Protocol):
     async def get(self, key: str) -> bytes | None:
         ...
 
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        ...
+
     async def set(self, key: str, pcm: bytes) -> None:
         ...
 
@@ -559,6 +695,9 @@ class RedisAudioCache:
             try:
                 self._client = AsyncRedis.from_url(
                     self._redis_url,
+                    max_connections=16,
+                    socket_keepalive=True,
+                    health_check_interval=30,
                     socket_connect_timeout=0.3,
                     socket_timeout=0.5,
                     retry_on_timeout=False,
@@ -570,30 +709,44 @@ class RedisAudioCache:
                 return None
         return self._client
 
+    def _decode(self, key: str, raw: Any) -> bytes | None:
+        if raw is None:
+            return None
+        if isinstance(raw, str):
+            pcm = raw.encode("latin1")
+        elif isinstance(raw, (bytes, bytearray, memoryview)):
+            pcm = bytes(raw)
+        else:
+            return None
+        if len(pcm) > self._max_audio_bytes:
+            logger.warning(
+                f"Redis cached payload too large ({len(pcm)} bytes), ignoring key={key[:24]}..."
+            )
+            return None
+        return pcm
+
     async def get(self, key: str) -> bytes | None:
         client = self._ensure_client()
         if client is None:
             return None
         try:
-            raw = await client.get(key)
-            if raw is None:
-                return None
-            if isinstance(raw, str):
-                pcm = raw.encode("latin1")
-            elif isinstance(raw, (bytes, bytearray, memoryview)):
-                pcm = bytes(raw)
-            else:
-                return None
-            if len(pcm) > self._max_audio_bytes:
-                logger.warning(
-                    f"Redis cached payload too large ({len(pcm)} bytes), ignoring key={key[:24]}..."
-                )
-                return None
-            return pcm
+            return self._decode(key, await client.get(key))
         except Exception as e:
             logger.debug(f"Redis cache get failed: {type(e).__name__}: {e}")
             return None
 
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Fetch several keys in a single MGET round-trip."""
+        client = self._ensure_client()
+        if client is None or not keys:
+            return [None] * len(keys)
+        try:
+            raws = await client.mget(keys)
+            return [self._decode(key, raw) for key, raw in zip(keys, raws)]
+        except Exception as e:
+            logger.debug(f"Redis cache mget failed: {type(e).__name__}: {e}")
+            return [None] * len(keys)
+
     async def set(self, key: str, pcm: bytes) -> None:
         if len(pcm) > self._max_audio_bytes:
             return
@@ -631,6 +784,24 @@ class RemoteChainAudioCache:
             return CacheHit(pcm=pcm, source=remote.name)
         return None
 
+    async def get_many(self, keys: list[str]) -> list[CacheHit | None]:
+        hits: list[CacheHit | None] = [None] * len(keys)
+        missing = list(range(len(keys)))
+        for idx, remote in enumerate(self._remotes):
+            if not missing:
+                break
+            pcms = await remote.get_many([keys[i] for i in missing])
+            still_missing = []
+            for i, pcm in zip(missing, pcms):
+                if pcm is None:
+                    still_missing.append(i)
+                    continue
+                for backfill in self._remotes[:idx]:
+                    await backfill.set(keys[i], pcm)
+                hits[i] = CacheHit(pcm=pcm, source=remote.name)
+            missing = still_missing
+        return hits
+
     async def set(self, key: str, pcm: bytes) -> None:
         for remote in self._remotes:
             await remote.set(key, pcm)
@@ -652,7 +823,7 @@ class TwoLayerAudioCache:
         return self._remote.backends
 
     async def get(self, key: str) -> CacheHit | None:
-        pcm = await self._local.get(key)
+        pcm = self._local.get_sync(key)
         if pcm is not None:
             return CacheHit(pcm=pcm, source="local")
 
@@ -663,6 +834,23 @@ class TwoLayerAudioCache:
                 return hit
         return None
 
+    async def get_many(self, keys: list[str]) -> list[CacheHit | None]:
+        """Look up several keys; remote misses are batched into one request."""
+        hits: list[CacheHit | None] = []
+        for key in keys:
+            pcm = self._local.get_sync(key)
+            hits.append(CacheHit(pcm=pcm, source="local") if pcm is not None else None)
+
+        if self._remote and self._remote.enabled:
+            missing = [i for i, hit in enumerate(hits) if hit is None]
+            if missing:
+                remote_hits = await self._remote.get_many([keys[i] for i in missing])
+                for i, hit in zip(missing, remote_hits):
+                    if hit is not None:
+                        await self._local.set(keys[i], hit.pcm)
+                        hits[i] = hit
+        return hits
+
     async def set(self, key: str, pcm: bytes) -> None:
         await self._local.set(key, pcm)
         if self._remote and self._remote.enabled:
@@ -676,24 +864,87 @@ def get_tts_cache() -> TwoLayerAudioCache:
     global _TTS_CACHE
     if _TTS_CACHE is None:
         remotes: list[RemoteAudioCache] = []
-        if TTS_CACHE_REDIS_URL:
+        if VOICE_CONFIG.tts_cache_redis_url:
             remotes.append(
                 RedisAudioCache(
-                    redis_url=TTS_CACHE_REDIS_URL,
-                    ttl_sec=TTS_CACHE_REDIS_TTL_SEC,
-                    max_audio_bytes=TTS_CACHE_MAX_AUDIO_BYTES,
+                    redis_url=VOICE_CONFIG.tts_cache_redis_url,
+                    ttl_sec=VOICE_CONFIG.tts_cache_redis_ttl_sec,
+                    max_audio_bytes=VOICE_CONFIG.tts_cache_max_audio_bytes,
                 )
             )
         _TTS_CACHE = TwoLayerAudioCache(
             local=LocalAudioCache(
-                max_items=TTS_CACHE_LOCAL_MAX_ITEMS,
-                max_bytes=TTS_CACHE_LOCAL_MAX_BYTES,
+                max_items=VOICE_CONFIG.tts_cache_local_max_items,
+                max_bytes=VOICE_CONFIG.tts_cache_local_max_bytes,
             ),
             remote=RemoteChainAudioCache(remotes) if remotes else None,
         )
     return _TTS_CACHE
 
 
+def _retry_backoff_s(attempt: int) -> float:
+    """Capped exponential backoff with jitter, so retries don't stampede the gateway."""
+    base = min(VOICE_CHAT_RETRY_MAX_S, VOICE_CHAT_RETRY_BASE_S * (2 ** (attempt - 1)))
+    return base * (1 + random.random() * VOICE_CHAT_RETRY_JITTER)
+
+
+_HTTP: aiohttp.ClientSession | None = None
+
+
+def _http() -> aiohttp.ClientSession:
+    """Shared keep-alive session for gateway calls (created lazily per job loop).
+
+    aiohttp already sets TCP_NODELAY on every connection it opens, so SSE
+    frames are never held back by Nagle; there is no connector flag to add.
+    """
+    global _HTTP
+    if _HTTP is None or _HTTP.closed:
+        _HTTP = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            ),
+            timeout=aiohttp.ClientTimeout(total=None),
+            # Large enough that a single SSE frame never has to wait on a refill.
+            read_bufsize=4 * 1024 * 1024,
+        )
+    return _HTTP
+
+
+async def close_http() -> None:
+    global _HTTP
+    if _HTTP is not None and not _HTTP.closed:
+        await _HTTP.close()
+    _HTTP = None
+
+
+async def _iter_sse_lines(content: aiohttp.StreamReader) -> AsyncIterator[bytes]:
+    """Yield newline-delimited SSE lines as soon as the bytes arrive.
+
+    Partial lines are kept as a list of pieces and joined only once their
+    newline shows up, so a large frame split over many reads isn't re-copied.
+    """
+    tail: list[bytes] = []
+    async for chunk in content.iter_any():
+        if b"\n" not in chunk:
+            tail.append(chunk)
+            continue
+        lines = chunk.split(b"\n")
+        if tail:
+            tail.append(lines[0])
+            lines[0] = b"".join(tail)
+            tail.clear()
+        last = lines.pop()
+        if last:
+            tail.append(last)
+        for line in lines:
+            yield line
+    if tail:
+        yield b"".join(tail)
+
+
 async def post_voice_usage(
     *,
     conversation_id: str,
@@ -714,17 +965,30 @@ async def post_voice_usage(
         "durationMs": duration_ms,
         "characters": characters,
     }
-    timeout = aiohttp.ClientTimeout(total=1.0, sock_connect=0.4, sock_read=0.6)
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(f"{GATEWAY_URL}/api/voice/usage", json=payload) as resp:
-                if resp.status >= 300:
-                    body = await resp.text()
-                    logger.warning(f"voice/usage failed status={resp.status}: {body[:160]}")
+        async with _http().post(
+            f"{GATEWAY_URL}/api/voice/usage",
+            data=_dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=_TEL_TIMEOUT,
+        ) as resp:
+            if resp.status >= 300:
+                body = await resp.text()
+                logger.warning(f"voice/usage failed status={resp.status}: {body[:160]}")
     except Exception as e:
         logger.warning(f"Failed posting voice usage: {type(e).__name__}: {e}")
 
 
+async def drain_voice_usage(queue: asyncio.Queue[dict[str, Any]]) -> None:
+    """Post queued usage events one at a time, in arrival order."""
+    while True:
+        item = await queue.get()
+        try:
+            await post_voice_usage(**item)
+        finally:
+            queue.task_done()
+
+
 async def post_voice_cache_metrics(
     *,
     conversation_id: str,
@@ -754,19 +1018,22 @@ async def post_voice_cache_metrics(
             "cacheMissAudioBytes": metrics.cache_miss_audio_bytes,
         },
     }
-    timeout = aiohttp.ClientTimeout(total=1.0, sock_connect=0.4, sock_read=0.6)
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(f"{GATEWAY_URL}/api/voice/cache-metrics", json=payload) as resp:
-                if resp.status >= 300:
-                    body = await resp.text()
-                    logger.warning(f"voice/cache-metrics failed status={resp.status}: {body[:160]}")
-                else:
-                    logger.info(
-                        "Voice cache metrics posted: "
-                        f"hits={metrics.cache_hits} misses={metrics.cache_misses} "
-                        f"hit_chars={metrics.cache_hit_chars} miss_chars={metrics.cache_miss_chars}"
-                    )
+        async with _http().post(
+            f"{GATEWAY_URL}/api/voice/cache-metrics",
+            data=_dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=_TEL_TIMEOUT,
+        ) as resp:
+            if resp.status >= 300:
+                body = await resp.text()
+                logger.warning(f"voice/cache-metrics failed status={resp.status}: {body[:160]}")
+            else:
+                logger.info(
+                    "Voice cache metrics posted: "
+                    f"hits={metrics.cache_hits} misses={metrics.cache_misses} "
+                    f"hit_chars={metrics.cache_hit_chars} miss_chars={metrics.cache_miss_chars}"
+                )
     except Exception as e:
         logger.warning(f"Failed posting voice cache metrics: {type(e).__name__}: {e}")
 
@@ -789,27 +1056,25 @@ class CachedStreamAdapter(lk_tts.StreamAdapter):
     ) -> None:
         super().__init__(tts=tts, sentence_tokenizer=sentence_tokenizer)
         self._cache = cache
-        self._cache_fingerprint = cache_fingerprint
+        self._fp_json_bytes = _dumps(cache_fingerprint)
         self._report_cache_metrics = report_cache_metrics
+        bytes_per_second = self.sample_rate * self.num_channels * 2  # pcm_s16le
+        self._sec_per_byte = 1.0 / bytes_per_second if bytes_per_second > 0 else 0.0
 
     def stream(
         self, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
     ) -> "_CachedStreamAdapterWrapper":
         return _CachedStreamAdapterWrapper(tts=self, conn_options=conn_options)
 
-    def _is_cacheable(self, text: str) -> bool:
-        normalized = _normalize_cache_text(text)
-        return bool(normalized) and len(normalized) <= TTS_CACHE_MAX_TEXT_CHARS
+    def _is_cacheable(self, text: str, *, text_norm: str | None = None) -> bool:
+        normalized = _normalize_cache_text(text) if text_norm is None else text_norm
+        return bool(normalized) and len(normalized) <= VOICE_CONFIG.tts_cache_max_text_chars
 
-    def _cache_key(self, text: str) -> str:
-        return _build_tts_cache_key(text=text, fingerprint=self._cache_fingerprint)
+    def _cache_key(self, text: str, *, text_norm: str | None = None) -> str:
+        return _build_tts_cache_key(text=text, fp_json=self._fp_json_bytes, text_norm=text_norm)
 
     def _pcm_duration(self, pcm: bytes) -> float:
-        bytes_per_sample = 2  # pcm_s16le
-        denom = self.sample_rate * self.num_channels * bytes_per_sample
-        if denom <= 0:
-            return 0.0
-        return len(pcm) / denom
+        return len(pcm) * self._sec_per_byte
 
 
 class _CachedStreamAdapterWrapper(lk_tts.SynthesizeStream):
@@ -857,76 +1122,176 @@ class _CachedStreamAdapterWrapper(lk_tts.SynthesizeStream):
         async def _synthesize() -> None:
             from livekit.agents.voice.io import TimedString
 
+            # Bind per-segment lookups to locals once; this loop runs for every sentence.
+            cache = self._tts._cache
+            is_cacheable = self._tts._is_cacheable
+            cache_key_for = self._tts._cache_key
+            pcm_duration = self._tts._pcm_duration
+            synthesize = self._tts._wrapped_tts.synthesize
+            max_audio_bytes = VOICE_CONFIG.tts_cache_max_audio_bytes
+
             duration = 0.0
             turn_metrics = VoiceCacheTurnMetrics()
-            async for ev in sent_stream:
-                output_emitter.push_timed_transcript(
-                    TimedString(text=ev.token, start_time=duration)
-                )
+            ready: asyncio.Queue[Any] = asyncio.Queue()
+            # (token, text, cache_key, lookup, slot) handed from the lookup stage to
+            # the emitter; `lookup` resolves to the batch's hits and `slot` indexes
+            # into it. A single FIFO consumer keeps audio in sentence order.
+            pending: asyncio.Queue[
+                tuple[str, str, str | None, asyncio.Task[list[CacheHit | None]] | None, int] | None
+            ] = asyncio.Queue(maxsize=2)
+            lookup_tasks: set[asyncio.Task[list[CacheHit | None]]] = set()
+            lookup_slots = asyncio.Semaphore(TTS_CACHE_MAX_INFLIGHT_LOOKUPS)
+            store_tasks: set[asyncio.Task[None]] = set()
+            store_slots = asyncio.Semaphore(TTS_CACHE_MAX_PENDING_STORES)
+
+            async def _read_sentences() -> None:
+                try:
+                    async for ev in sent_stream:
+                        ready.put_nowait(ev)
+                finally:
+                    ready.put_nowait(None)
 
-                text = ev.token.strip()
-                if not text:
-                    continue
+            async def _lookup() -> None:
+                try:
+                    done = False
+                    while not done:
+                        # Take whatever sentences are already tokenized (never waiting
+                        # for more) so their cache lookups share one round-trip.
+                        batch = [await ready.get()]
+                        while len(batch) < TTS_CACHE_LOOKAHEAD_SEGMENTS and not ready.empty():
+                            batch.append(ready.get_nowait())
+                        if batch[-1] is None:
+                            done = True
+                            batch.pop()
+
+                        segments = [(ev.token, ev.token.strip()) for ev in batch]
+                        cache_keys: dict[int, str] = {}
+                        for idx, (_, text) in enumerate(segments):
+                            if not text:
+                                continue
+                            text_norm = _normalize_cache_text(text)
+                            if is_cacheable(text, text_norm=text_norm):
+                                cache_keys[idx] = cache_key_for(text, text_norm=text_norm)
+                        # Start the lookup without awaiting it, so its round-trip
+                        # overlaps with audio still being emitted for earlier sentences.
+                        lookup: asyncio.Task[list[CacheHit | None]] | None = None
+                        if cache_keys:
+                            lookup = asyncio.create_task(_get_many(list(cache_keys.values())))
+                            lookup_tasks.add(lookup)
+                            lookup.add_done_callback(lookup_tasks.discard)
+                        slots = {idx: slot for slot, idx in enumerate(cache_keys)}
+
+                        for idx, (token, text) in enumerate(segments):
+                            cache_key = cache_keys.get(idx)
+                            await pending.put(
+                                (token, text, cache_key, lookup if cache_key else None, slots.get(idx, 0))
+                            )
+                except asyncio.CancelledError:
+                    # The emitter is tearing down and won't read again; a blocking
+                    # put on the full queue here would hang cancel_and_wait.
+                    raise
+                except BaseException:
+                    # Make room so the emitter wakes up and surfaces the error.
+                    while not pending.empty():
+                        pending.get_nowait()
+                    pending.put_nowait(None)
+                    raise
+                else:
+                    await pending.put(None)
 
-                turn_metrics.segments += 1
-                cache_hit: CacheHit | None = None
-                cache_key = self._tts._cache_key(text)
-                if self._tts._is_cacheable(text):
-                    cache_hit = await self._tts._cache.get(cache_key)
-
-                if cache_hit is not None:
-                    output_emitter.push(cache_hit.pcm)
-                    duration += self._tts._pcm_duration(cache_hit.pcm)
-                    output_emitter.flush()
-                    turn_metrics.cache_hits += 1
-                    turn_metrics.cache_hit_chars += len(text)
-                    turn_metrics.cache_hit_audio_bytes += len(cache_hit.pcm)
-                    logger.info(
-                        f"TTS cache hit ({cache_hit.source}) chars={len(text)} bytes={len(cache_hit.pcm)}"
+            async def _get_many(keys: list[str]) -> list[CacheHit | None]:
+                async with lookup_slots:
+                    return await cache.get_many(keys)
+
+            async def _store(cache_key: str, text: str, pcm: bytes) -> None:
+                async with store_slots:
+                    await cache.set(cache_key, pcm)
+                logger.info(
+                    f"TTS cache store chars={len(text)} bytes={len(pcm)} remote={cache.remote_enabled}"
+                )
+
+            stages = [
+                asyncio.create_task(_read_sentences()),
+                asyncio.create_task(_lookup()),
+            ]
+            try:
+                while (item := await pending.get()) is not None:
+                    token, text, cache_key, lookup, slot = item
+                    cache_hit = (await lookup)[slot] if lookup is not None else None
+                    output_emitter.push_timed_transcript(
+                        TimedString(text=token, start_time=duration)
                     )
-                    continue
+                    if not text:
+                        continue
 
-                pcm_buffer = bytearray()
-                try:
-                    async with self._tts._wrapped_tts.synthesize(
-                        text, conn_options=self._wrapped_tts_conn_options
-                    ) as tts_stream:
-                        async for audio in tts_stream:
-                            pcm = audio.frame.data.tobytes()
-                            pcm_buffer.extend(pcm)
-                            output_emitter.push(pcm)
-                            duration += audio.frame.duration
-                        output_emitter.flush()
-                except Exception as e:
-                    logger.error(f"TTS synthesis failed for segment ({len(text)} chars): {e}")
-                    continue
+                    turn_metrics.segments += 1
 
-                if pcm_buffer and self._tts._is_cacheable(text):
-                    pcm = bytes(pcm_buffer)
-                    if len(pcm) <= TTS_CACHE_MAX_AUDIO_BYTES:
-                        await self._tts._cache.set(cache_key, pcm)
+                    if cache_hit is not None:
+                        output_emitter.push(cache_hit.pcm)
+                        duration += pcm_duration(cache_hit.pcm)
+                        output_emitter.flush()
+                        turn_metrics.cache_hits += 1
+                        turn_metrics.cache_hit_chars += len(text)
+                        turn_metrics.cache_hit_audio_bytes += len(cache_hit.pcm)
                         logger.info(
-                            f"TTS cache store chars={len(text)} bytes={len(pcm)} remote={self._tts._cache.remote_enabled}"
+                            f"TTS cache hit ({cache_hit.source}) chars={len(text)} bytes={len(cache_hit.pcm)}"
                         )
-                    turn_metrics.cache_misses += 1
-                    turn_metrics.cache_miss_chars += len(text)
-                    turn_metrics.cache_miss_audio_bytes += len(pcm)
-                elif self._tts._is_cacheable(text):
-                    turn_metrics.cache_misses += 1
-                    turn_metrics.cache_miss_chars += len(text)
+                        continue
+
+                    # Collect frames in a list and join once; stop collecting as
+                    # soon as the segment is too large to cache anyway.
+                    chunks: list[bytes] = []
+                    total_len = 0
+                    try:
+                        async with synthesize(
+                            text, conn_options=self._wrapped_tts_conn_options
+                        ) as tts_stream:
+                            async for audio in tts_stream:
+                                pcm = audio.frame.data.tobytes()
+                                total_len += len(pcm)
+                                if cache_key is not None and total_len <= max_audio_bytes:
+                                    chunks.append(pcm)
+                                output_emitter.push(pcm)
+                                duration += audio.frame.duration
+                            output_emitter.flush()
+                    except Exception as e:
+                        logger.error(f"TTS synthesis failed for segment ({len(text)} chars): {e}")
+                        continue
+
+                    if total_len and cache_key is not None:
+                        if total_len <= max_audio_bytes:
+                            # Persist in the background so the next sentence isn't
+                            # held up by the Redis write.
+                            store = asyncio.create_task(_store(cache_key, text, b"".join(chunks)))
+                            store_tasks.add(store)
+                            store.add_done_callback(store_tasks.discard)
+                        turn_metrics.cache_misses += 1
+                        turn_metrics.cache_miss_chars += len(text)
+                        turn_metrics.cache_miss_audio_bytes += total_len
+                    elif cache_key is not None:
+                        turn_metrics.cache_misses += 1
+                        turn_metrics.cache_miss_chars += len(text)
+
+                # Surface any stage failure, then let pending writes land.
+                await asyncio.gather(*stages)
+                if store_tasks:
+                    await asyncio.gather(*store_tasks)
+            finally:
+                await lk_utils.aio.cancel_and_wait(*stages, *lookup_tasks, *store_tasks)
 
             if self._tts._report_cache_metrics:
                 await self._tts._report_cache_metrics(turn_metrics)
 
-        tasks = [
-            asyncio.create_task(_forward_input()),
-            asyncio.create_task(_synthesize()),
-        ]
         try:
-            await asyncio.gather(*tasks)
+            # TaskGroup cancels the sibling as soon as either side fails.
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_forward_input())
+                tg.create_task(_synthesize())
+        except ExceptionGroup as eg:
+            # Re-raise the bare error so the base stream's APIError handling applies.
+            raise eg.exceptions[0] from None
         finally:
             await sent_stream.aclose()
-            await lk_utils.aio.cancel_and_wait(*tasks)
 
 
 # ── JOI Agent ──
@@ -936,7 +1301,7 @@ class JOIAgent(Agent):
         self,
         conversation_id: str,
         agent_id: str,
-        pending_turns: deque[dict[str, str]],
+        pending_turns: asyncio.Queue[str],
         livekit_config: dict[str, Any],
     ):
         super().__init__(
@@ -994,88 +1359,129 @@ class JOIAgent(Agent):
             "voicePromptSuffix": voice_prompt_suffix,
         }
         turn_started = time.perf_counter()
-
-        timeout = aiohttp.ClientTimeout(
-            total=None,
-            sock_connect=VOICE_CHAT_CONNECT_TIMEOUT_S,
-            sock_read=VOICE_CHAT_READ_TIMEOUT_S,
-        )
+        retry_deadline = turn_started + VOICE_CHAT_RETRY_DEADLINE_S
 
         for attempt in range(1, VOICE_CHAT_MAX_ATTEMPTS + 1):
             chunk_count = 0
             first_chunk_ms = None
+            pending: list[str] = []
+            pending_len = 0
+            last_flush: float | None = None
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.post(
-                        f"{GATEWAY_URL}/api/voice/chat",
-                        json=payload,
-                        headers={"Accept": "text/event-stream"},
-                    ) as resp:
-                        if resp.status != 200:
-                            body = await resp.text()
-                            logger.error(f"Gateway returned {resp.status}: {body}")
-                            yield "Sorry, I encountered an error."
-                            return
-
-                        async for line in resp.content:
-                            line = line.decode("utf-8").strip()
-                            if not line.startswith("data: "):
-                                continue
-
-                            data = json.loads(line[6:])
-
+                async with _http().post(
+                    f"{GATEWAY_URL}/api/voice/chat",
+                    json=payload,
+                    headers={"Accept": "text/event-stream", "Cache-Control": "no-cache"},
+                    timeout=_SSE_TIMEOUT,
+                ) as resp:
+                    if resp.status != 200:
+                        body = await resp.text()
+                        backoff_s = _retry_backoff_s(attempt)
+                        # 5xx may be a transient brownout; 4xx won't fix itself.
+                        if (
+                            resp.status >= 500
+                            and attempt < VOICE_CHAT_MAX_ATTEMPTS
+                            and time.perf_counter() + backoff_s < retry_deadline
+                        ):
+                            logger.warning(
+                                f"Gateway returned {resp.status} on attempt {attempt}/{VOICE_CHAT_MAX_ATTEMPTS}: "
+                                f"{body[:160]}; retrying in {backoff_s:.1f}s"
+                            )
+                            await asyncio.sleep(backoff_s)
+                            continue
+                        logger.error(f"Gateway returned {resp.status}: {body}")
+                        yield "Sorry, I encountered an error."
+                        return
+
+                    async for line in _iter_sse_lines(resp.content):
+                        # Match on raw bytes so heartbeats/comments never get decoded.
+                        if not line.startswith(b"data: "):
+                            continue
+
+                        frame = line[6:]
+                        delta = _parse_stream_delta(frame)
+                        if delta is None:
+                            data = _loads(frame)
                             if data["type"] == "stream":
                                 delta = data["delta"]
-                                chunk_count += 1
-                                if first_chunk_ms is None:
+
+                        if delta is not None:
+                            chunk_count += 1
+                            if chunk_count <= 3 or chunk_count % 20 == 0:
+                                # Time-to-first-chunk is sampled once, on the first delta.
+                                if chunk_count == 1:
                                     first_chunk_ms = (time.perf_counter() - turn_started) * 1000
-                                if chunk_count <= 3 or chunk_count % 20 == 0:
-                                    logger.info(f"Stream chunk #{chunk_count}: {delta[:80]!r}")
-                                replaced = push_replace(delta)
-                                if replaced:
-                                    cleaned = strip_voice_markers(replaced)
-                                    if cleaned:
-                                        yield cleaned
-
-                            elif data["type"] == "done":
-                                message_id = data.get("messageId")
-                                if isinstance(message_id, str) and message_id:
-                                    self.pending_turns.append(
-                                        {
-                                            "conversationId": self.conversation_id,
-                                            "agentId": self.agent_id,
-                                            "messageId": message_id,
-                                        }
-                                    )
-                                remaining = flush_replace()
-                                if remaining:
-                                    cleaned_remaining = strip_voice_markers(remaining)
-                                    if cleaned_remaining:
-                                        yield cleaned_remaining
-                                total_ms = (time.perf_counter() - turn_started) * 1000
-                                metrics_parts = [
-                                    f"chunks={chunk_count}",
-                                    f"model={data.get('model')}",
-                                    f"tool_model={data.get('toolModel')}" if data.get("toolModel") else None,
-                                    f"usage={data.get('usage')}",
-                                    f"total_ms={total_ms:.0f}",
-                                    f"gateway_latency_ms={data.get('latencyMs')}",
-                                ]
-                                metrics_parts = [part for part in metrics_parts if part]
-                                if first_chunk_ms is not None:
-                                    metrics_parts.append(f"first_chunk_ms={first_chunk_ms:.0f}")
-                                logger.info("Stream done: " + ", ".join(metrics_parts))
-                                return
-
-                            elif data["type"] == "error":
-                                logger.error(f"Gateway error: {data.get('error')}")
-                                yield "Sorry, I encountered an error."
-                                return
+                                logger.info(f"Stream chunk #{chunk_count}: {delta[:80]!r}")
+                            replaced = push_replace(delta)
+                            if replaced:
+                                cleaned = strip_voice_markers(replaced)
+                                if cleaned:
+                                    pending.append(cleaned)
+                                    pending_len += len(cleaned)
+                                    if (
+                                        last_flush is None
+                                        or pending_len > VOICE_TTS_COALESCE_CHARS
+                                        or not _TTS_FLUSH_CHARS.isdisjoint(cleaned)
+                                        or time.perf_counter() - last_flush >= VOICE_TTS_COALESCE_S
+                                    ):
+                                        text = "".join(pending)
+                                        pending.clear()
+                                        pending_len = 0
+                                        yield text
+                                        last_flush = time.perf_counter()
+
+                        elif data["type"] == "done":
+                            message_id = data.get("messageId")
+                            if isinstance(message_id, str) and message_id:
+                                try:
+                                    self.pending_turns.put_nowait(message_id)
+                                except asyncio.QueueFull:
+                                    # Nothing reported the oldest turn; drop it instead of growing.
+                                    self.pending_turns.get_nowait()
+                                    self.pending_turns.put_nowait(message_id)
+                            remaining = flush_replace()
+                            if remaining:
+                                cleaned_remaining = strip_voice_markers(remaining)
+                                if cleaned_remaining:
+                                    pending.append(cleaned_remaining)
+                            if pending:
+                                yield "".join(pending)
+                            total_ms = (time.perf_counter() - turn_started) * 1000
+                            metrics_parts = [
+                                f"chunks={chunk_count}",
+                                f"model={data.get('model')}",
+                                f"tool_model={data.get('toolModel')}" if data.get("toolModel") else None,
+                                f"usage={data.get('usage')}",
+                                f"total_ms={total_ms:.0f}",
+                                f"gateway_latency_ms={data.get('latencyMs')}",
+                            ]
+                            metrics_parts = [part for part in metrics_parts if part]
+                            if first_chunk_ms is not None:
+                                metrics_parts.append(f"first_chunk_ms={first_chunk_ms:.0f}")
+                            logger.info("Stream done: " + ", ".join(metrics_parts))
+                            return
+
+                        elif data["type"] == "error":
+                            logger.error(f"Gateway error: {data.get('error')}")
+                            if pending:
+                                yield "".join(pending)
+                            yield "Sorry, I encountered an error."
+                            return
+
+                    # Stream closed without a done event; don't strand buffered text.
+                    if pending:
+                        text = "".join(pending)
+                        pending.clear()
+                        yield text
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                is_retryable = chunk_count == 0 and attempt < VOICE_CHAT_MAX_ATTEMPTS
+                backoff_s = _retry_backoff_s(attempt)
+                is_retryable = (
+                    chunk_count == 0
+                    and attempt < VOICE_CHAT_MAX_ATTEMPTS
+                    and time.perf_counter() + backoff_s < retry_deadline
+                )
                 if is_retryable:
-                    backoff_s = 0.3 * attempt
                     logger.warning(
                         f"SSE attempt {attempt}/{VOICE_CHAT_MAX_ATTEMPTS} failed before stream "
                         f"started ({type(e).__name__}: {e}); retrying in {backoff_s:.1f}s"
@@ -1084,10 +1490,14 @@ class JOIAgent(Agent):
                     continue
 
                 logger.exception(f"SSE connection failed on attempt {attempt}: {e}")
+                if pending:
+                    yield "".join(pending)
                 yield "Sorry, I couldn't connect to the server."
                 return
             except Exception as e:
                 logger.exception(f"SSE connection failed on attempt {attempt}: {e}")
+                if pending:
+                    yield "".join(pending)
                 yield "Sorry, I couldn't connect to the server."
                 return
 
@@ -1097,6 +1507,17 @@ class JOIAgent(Agent):
 server = AgentServer()
 
 
+@lru_cache(maxsize=1024)
+def _parse_meta(raw: str) -> dict[str, Any]:
+    # Rejoining rooms (staging bots especially) repeat identical metadata
+    # blobs. Callers only read from the result, so sharing it is safe.
+    try:
+        meta = _loads(raw)
+    except (ValueError, TypeError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
 @server.rtc_session(agent_name="joi-voice")
 async def entrypoint(ctx: agents.JobContext):
     """Handle a new voice session."""
@@ -1106,12 +1527,9 @@ async def entrypoint(ctx: agents.JobContext):
 
     room_meta = ctx.room.metadata
     if room_meta:
-        try:
-            meta = json.loads(room_meta)
-            conversation_id = meta.get("conversationId")
-            agent_id = meta.get("agentId", "personal")
-        except (json.JSONDecodeError, TypeError):
-            pass
+        meta = _parse_meta(room_meta)
+        conversation_id = meta.get("conversationId")
+        agent_id = meta.get("agentId", "personal")
 
     # Fallback #1: parse room name (`joi-voice-<conversationId>`)
     if not conversation_id:
@@ -1128,9 +1546,8 @@ async def entrypoint(ctx: agents.JobContext):
             for participant in ctx.room.remote_participants.values():
                 if not participant.metadata:
                     continue
-                try:
-                    pmeta = json.loads(participant.metadata)
-                except (json.JSONDecodeError, TypeError):
+                pmeta = _parse_meta(participant.metadata)
+                if not pmeta:
                     continue
                 conv = pmeta.get("conversationId")
                 if conv:
@@ -1147,7 +1564,22 @@ async def entrypoint(ctx: agents.JobContext):
         import uuid
         conversation_id = str(uuid.uuid4())
 
-    pending_turns: deque[dict[str, str]] = deque()
+    # Message ids of finished turns; conversation/agent are fixed per session.
+    pending_turns: asyncio.Queue[str] = asyncio.Queue(maxsize=PENDING_TURNS_MAX)
+    usage_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=VOICE_USAGE_QUEUE_MAX)
+    usage_worker = asyncio.create_task(drain_voice_usage(usage_queue))
+
+    async def _shutdown_http() -> None:
+        # Shutdown callbacks run concurrently, so drain queued usage here
+        # before the shared HTTP session closes underneath it.
+        try:
+            await asyncio.wait_for(usage_queue.join(), timeout=VOICE_USAGE_DRAIN_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {usage_queue.qsize()} unsent voice usage events on shutdown")
+        usage_worker.cancel()
+        await close_http()
+
+    ctx.add_shutdown_callback(_shutdown_http)
 
     logger.info(
         f"Entering room {ctx.room.name}, "
@@ -1167,12 +1599,7 @@ async def entrypoint(ctx: agents.JobContext):
 
     stt_language = livekit_config.get("language") or LK_CONFIG.get("language", "en")
     # Normalize short codes to Deepgram-compatible codes
-    if stt_language == "en":
-        stt_language = "en-US"
-    elif stt_language == "de":
-        stt_language = "de"
-    elif len(stt_language) == 2:
-        stt_language = stt_language  # Deepgram accepts 2-letter codes for most languages
+    stt_language = _STT_LANGUAGE_MAP.get(stt_language, stt_language)
     session_language = _normalize_language_code(stt_language)
     logger.info(f"STT language: {stt_language}")
 
@@ -1212,11 +1639,14 @@ async def entrypoint(ctx: agents.JobContext):
     )
 
     async def report_cache_metrics(turn_metrics: VoiceCacheTurnMetrics) -> None:
-        turn_meta = pending_turns.popleft() if pending_turns else None
+        try:
+            message_id = pending_turns.get_nowait()
+        except asyncio.QueueEmpty:
+            message_id = None
         await post_voice_cache_metrics(
             conversation_id=conversation_id,
             agent_id=agent_id,
-            message_id=turn_meta["messageId"] if turn_meta else None,
+            message_id=message_id,
             provider="cartesia",
             model=tts_model,
             voice=tts_voice or "",
@@ -1224,7 +1654,7 @@ async def entrypoint(ctx: agents.JobContext):
         )
 
     tts_engine: lk_tts.TTS = base_tts
-    if TTS_CACHE_ENABLED:
+    if VOICE_CONFIG.tts_cache_enabled:
         cache = get_tts_cache()
         tts_engine = CachedStreamAdapter(
             tts=base_tts,
@@ -1241,13 +1671,13 @@ async def entrypoint(ctx: agents.JobContext):
         )
         logger.info(
             "TTS cache enabled: "
-            f"local_max_items={TTS_CACHE_LOCAL_MAX_ITEMS}, "
-            f"local_max_bytes={TTS_CACHE_LOCAL_MAX_BYTES}, "
+            f"local_max_items={VOICE_CONFIG.tts_cache_local_max_items}, "
+            f"local_max_bytes={VOICE_CONFIG.tts_cache_local_max_bytes}, "
             f"remote_enabled={cache.remote_enabled}, "
             f"remote_backends={','.join(cache.remote_backends) if cache.remote_backends else 'none'}, "
             f"language={session_language}, "
-            f"max_text_chars={TTS_CACHE_MAX_TEXT_CHARS}, "
-            f"max_audio_bytes={TTS_CACHE_MAX_AUDIO_BYTES}"
+            f"max_text_chars={VOICE_CONFIG.tts_cache_max_text_chars}, "
+            f"max_audio_bytes={VOICE_CONFIG.tts_cache_max_audio_bytes}"
         )
     else:
         logger.info("TTS cache disabled")
@@ -1257,8 +1687,8 @@ async def entrypoint(ctx: agents.JobContext):
         tts=tts_engine,
         # STT turn detection is more robust here than VAD for low mic levels.
         turn_detection="stt",
-        min_endpointing_delay=VOICE_MIN_ENDPOINT_DELAY_S,
-        max_endpointing_delay=VOICE_MAX_ENDPOINT_DELAY_S,
+        min_endpointing_delay=VOICE_CONFIG.min_endpoint_delay_s,
+        max_endpointing_delay=VOICE_CONFIG.max_endpoint_delay_s,
     )
 
     agent = JOIAgent(
@@ -1285,16 +1715,22 @@ async def entrypoint(ctx: agents.JobContext):
         )
         duration_ms = int(ev.audio_duration * 1000)
         if duration_ms > 0:
-            asyncio.ensure_future(
-                post_voice_usage(
-                    conversation_id=conversation_id,
-                    agent_id=agent_id,
-                    provider="deepgram",
-                    service="stt",
-                    model=stt_model,
-                    duration_ms=duration_ms,
-                )
-            )
+            item = {
+                "conversation_id": conversation_id,
+                "agent_id": agent_id,
+                "provider": "deepgram",
+                "service": "stt",
+                "model": stt_model,
+                "duration_ms": duration_ms,
+            }
+            try:
+                usage_queue.put_nowait(item)
+            except asyncio.QueueFull:
+                # Usage endpoint is backed up; keep the newest events.
+                usage_queue.get_nowait()
+                usage_queue.task_done()
+                usage_queue.put_nowait(item)
+                logger.warning("Voice usage queue full; dropped oldest event")
 
     stt.on("metrics_collected", _on_stt_metrics)
 
@@ -123,7 +123,7 @@ is_python_compatible() {
   version="$(python_version_tuple "$bin" 2>/dev/null || echo "0.0")"
   major="${version%%.*}"
   minor="${version##*.}"
-  [ "$major" -gt 3 ] || { [ "$major" -eq 3 ] && [ "$minor" -ge 10 ]; }
+  [ "$major" -gt 3 ] || { [ "$major" -eq 3 ] && [ "$minor" -ge 11 ]; }
 }
 
 PYTHON_BIN="$(resolve_python_bin || true)"
@@ -133,7 +133,7 @@ if [ -z "$PYTHON_BIN" ]; then
 fi
 
 if ! is_python_compatible "$PYTHON_BIN"; then
-  echo "❌ Python 3.10+ required, found $(python_version_tuple "$PYTHON_BIN")."
+  echo "❌ Python 3.11+ required, found $(python_version_tuple "$PYTHON_BIN")."
   exit 1
 fi
 
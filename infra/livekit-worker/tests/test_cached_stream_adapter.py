@@ -0,0 +1,94 @@
+"""Regression tests for CachedStreamAdapter.
+
+Run from infra/livekit-worker:
+  python -m unittest discover -s tests
+"""
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import agent  # noqa: E402
+from livekit import rtc  # noqa: E402
+from livekit.agents import tts as lk_tts  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+class _SynthesizedAudio:
+    def __init__(self, frame: rtc.AudioFrame):
+        self.frame = frame
+
+
+class _SlowChunkedStream:
+    """Yields a few frames per segment, slowly enough to close mid-reply."""
+
+    def __init__(self, text: str):
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self._frames()
+
+    async def _frames(self):
+        for i in range(5):
+            await asyncio.sleep(0.1)
+            samples = 480
+            yield _SynthesizedAudio(
+                rtc.AudioFrame(
+                    data=bytes([i + 1]) * (samples * 2),
+                    sample_rate=SAMPLE_RATE,
+                    num_channels=1,
+                    samples_per_channel=samples,
+                )
+            )
+
+
+class _SlowTTS(lk_tts.TTS):
+    def __init__(self):
+        super().__init__(
+            capabilities=lk_tts.TTSCapabilities(streaming=False),
+            sample_rate=SAMPLE_RATE,
+            num_channels=1,
+        )
+
+    def synthesize(self, text, *, conn_options=None):
+        return _SlowChunkedStream(text)
+
+
+class CachedStreamAdapterCloseTest(unittest.IsolatedAsyncioTestCase):
+    async def test_close_while_synthesizing_does_not_hang(self):
+        cache = agent.TwoLayerAudioCache(
+            local=agent.LocalAudioCache(64, 1 << 24), remote=None
+        )
+        adapter = agent.CachedStreamAdapter(
+            tts=_SlowTTS(),
+            cache=cache,
+            cache_fingerprint={"test": "close"},
+        )
+        stream = adapter.stream()
+        for i in range(6):
+            stream.push_text(f"This is sentence number {i} of a longer reply. ")
+
+        async def _consume():
+            async for _ in stream:
+                pass
+
+        consumer = asyncio.create_task(_consume())
+        await asyncio.sleep(0.8)
+        # Interrupting the reply must tear the pipeline down promptly.
+        await asyncio.wait_for(stream.aclose(), timeout=5.0)
+        consumer.cancel()
+        await asyncio.gather(consumer, return_exceptions=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
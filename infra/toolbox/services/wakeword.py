@@ -37,8 +37,16 @@ app = FastAPI(title="JOI Wake Word Service")
 SAMPLE_RATE = 16000
 # Chunk size in samples — openWakeWord expects ~80ms chunks (1280 samples at 16kHz)
 CHUNK_SAMPLES = 1280
+# Chunks fed to the model per predict() call; openWakeWord scores each 80 ms
+# frame and returns the max. Larger batches cut per-call overhead but add up to
+# (N-1) * 80 ms of detection latency.
+BATCH_CHUNKS = max(1, int(os.environ.get("WAKEWORD_BATCH_CHUNKS", "2")))
 # Minimum confidence to trigger detection
 CONFIDENCE_THRESHOLD = float(os.environ.get("WAKEWORD_THRESHOLD", "0.5"))
+# Batches whose int16 peak stays below this skip inference entirely (0 disables)
+SILENCE_PEAK_THRESHOLD = int(os.environ.get("WAKEWORD_SILENCE_PEAK", "500"))
+# Keep predicting this many quiet batches after sound, so a phrase isn't cut off mid-word
+SILENCE_TAIL_BATCHES = int(os.environ.get("WAKEWORD_SILENCE_TAIL", "5"))
 # Cooldown after detection to avoid rapid re-triggers (seconds)
 DETECTION_COOLDOWN_S = float(os.environ.get("WAKEWORD_COOLDOWN", "3.0"))
 # Custom model path (if trained)
@@ -49,6 +57,9 @@ WAKEWORD_NAME = os.environ.get("WAKEWORD_NAME", "hey_jarvis")
 # ── Model loading ──
 
 _oww_model = None
+# The model is shared and keeps streaming state between predict() calls, so
+# inference is serialized even though it runs off the event loop.
+_predict_lock = asyncio.Lock()
 
 
 def get_model():
@@ -88,6 +99,12 @@ def get_model():
     return _oww_model
 
 
+async def predict_async(model, audio_array: np.ndarray) -> dict:
+    """Run inference in a worker thread so websocket I/O isn't blocked (ORT releases the GIL)."""
+    async with _predict_lock:
+        return await asyncio.to_thread(model.predict, audio_array)
+
+
 # ── Health endpoint ──
 
 
@@ -116,30 +133,69 @@ async def wakeword_ws(ws: WebSocket):
     log.info(f"Client connected: {client}")
 
     model = get_model()
+    loop = asyncio.get_running_loop()
     last_detection_time = 0.0
-    audio_buffer = bytearray()
+
+    # Process BATCH_CHUNKS chunks of CHUNK_SAMPLES (1280 samples * 2 bytes =
+    # 2560 bytes) at a time. Audio lands in a reusable buffer tracked by
+    # read/write cursors, and each batch is handed to the model as a zero-copy view.
+    chunk_samples = CHUNK_SAMPLES * BATCH_CHUNKS
+    chunk_bytes = chunk_samples * 2
+    buf = bytearray(chunk_bytes * 4)
+    view = memoryview(buf)
+    # One int16 array over the whole buffer; batches are plain slices of it
+    samples = np.frombuffer(buf, dtype=np.int16)
+    read_pos = write_pos = 0
+    quiet_batches = 0
 
     try:
         while True:
             data = await ws.receive_bytes()
-            audio_buffer.extend(data)
-
-            # Process in chunks of CHUNK_SAMPLES (1280 samples * 2 bytes = 2560 bytes)
-            chunk_bytes = CHUNK_SAMPLES * 2
-            while len(audio_buffer) >= chunk_bytes:
-                chunk = audio_buffer[:chunk_bytes]
-                audio_buffer = audio_buffer[chunk_bytes:]
-
-                # Convert bytes to int16 numpy array
-                audio_array = np.frombuffer(bytes(chunk), dtype=np.int16)
+            if write_pos + len(data) > len(buf):
+                # Move the leftover partial chunk to the front (growing the
+                # buffer if a single message doesn't fit).
+                residual = bytes(view[read_pos:write_pos])
+                if len(residual) + len(data) > len(buf):
+                    # Keep the size even so it maps onto whole int16 samples
+                    size = max(len(buf) * 2, len(residual) + len(data) + 1) & ~1
+                    buf = bytearray(size)
+                    view = memoryview(buf)
+                    samples = np.frombuffer(buf, dtype=np.int16)
+                buf[:len(residual)] = residual
+                read_pos, write_pos = 0, len(residual)
+            buf[write_pos:write_pos + len(data)] = data
+            write_pos += len(data)
+
+            while write_pos - read_pos >= chunk_bytes:
+                # int16 view straight over the receive buffer (read_pos is
+                # always a whole number of batches, so it is sample-aligned)
+                start = read_pos >> 1
+                audio_array = samples[start:start + chunk_samples]
+                read_pos += chunk_bytes
+                if read_pos == write_pos:
+                    read_pos = write_pos = 0
+
+                # Cheap vectorized peak check (max/min avoid abs() overflow on -32768)
+                if SILENCE_PEAK_THRESHOLD > 0:
+                    peak = max(int(audio_array.max()), -int(audio_array.min()))
+                    if peak < SILENCE_PEAK_THRESHOLD:
+                        quiet_batches += 1
+                        if quiet_batches > SILENCE_TAIL_BATCHES:
+                            continue
+                    else:
+                        quiet_batches = 0
 
                 # Run prediction
-                prediction = model.predict(audio_array)
+                prediction = await predict_async(model, audio_array)
+
+                # Nothing fired (the common case): skip the per-model loop
+                if max(prediction.values(), default=0.0) < CONFIDENCE_THRESHOLD:
+                    continue
 
                 # Check each model's prediction
                 for name, confidence in prediction.items():
                     if confidence >= CONFIDENCE_THRESHOLD:
-                        now = asyncio.get_event_loop().time()
+                        now = loop.time()
                         if now - last_detection_time < DETECTION_COOLDOWN_S:
                             continue
                         last_detection_time = now
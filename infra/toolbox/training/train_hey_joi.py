@@ -17,9 +17,19 @@ import sys
 import subprocess
 import tempfile
 import shutil
+import math
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# openWakeWord is resolved once at import; None when not installed
+try:
+    import openwakeword
+    from openwakeword import Model as OWWModel
+except ImportError:
+    openwakeword = OWWModel = None
+
 OUTPUT_DIR = Path("/output")
 VOICES_DIR = Path("/workspace/voices")
 PIPER_DIR = Path("/workspace/piper-sample-generator")
@@ -37,6 +47,15 @@ VARIANTS = [
 # Speed variations for diversity
 LENGTH_SCALES = [0.8, 0.9, 1.0, 1.1, 1.2]
 
+# Target sample rate expected by openWakeWord
+TARGET_SR = 16000
+
+# Files handed to each decode worker per batch
+DECODE_CHUNKSIZE = 32
+
+# Seed for sample order and generated negatives, so runs are reproducible
+TRAIN_SEED = 1337
+
 
 def generate_samples():
     """Generate synthetic speech samples using Piper TTS."""
@@ -86,13 +105,10 @@ def generate_samples():
 
 def train_model(samples_dir: Path):
     """Train the wake word model using openWakeWord's training pipeline."""
-    try:
-        import openwakeword
-        from openwakeword import Model
-        print(f"\n  openWakeWord version: {openwakeword.__version__}")
-    except ImportError:
+    if openwakeword is None:
         print("  [ERROR] openwakeword not installed")
         return None
+    print(f"\n  openWakeWord version: {openwakeword.__version__}")
 
     # Check if openwakeword has training utilities
     train_module = None
@@ -122,20 +138,73 @@ def train_model(samples_dir: Path):
     return train_manual(samples_dir)
 
 
+@lru_cache(maxsize=8)
+def _resample_filter(sr: int):
+    """Anti-aliasing FIR for sr -> TARGET_SR, built once per rate per worker.
+
+    Mirrors resample_poly's default design (Kaiser, beta=5) so passing the
+    taps back as `window` gives identical output without redesigning the
+    filter for every file.
+    """
+    from scipy.signal import firwin
+
+    g = math.gcd(TARGET_SR, sr)
+    up, down = TARGET_SR // g, sr // g
+    max_rate = max(up, down)
+    taps = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    return up, down, taps.astype(np.float32)
+
+
+def _iter_wavs(root: str):
+    """Yield WAV paths under root as plain strings (no Path objects)."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_wavs(entry.path)
+            elif entry.name.endswith(".wav"):
+                yield entry.path
+
+
+def _load_and_prep(wav_path: str):
+    """Decode one WAV to 16kHz mono int16. Runs in a worker process.
+
+    Returns (audio, None) on success or (None, error message) on failure.
+    """
+    import soundfile as sf
+    from scipy.signal import resample_poly
+
+    try:
+        audio, sr = sf.read(wav_path, dtype="int16", always_2d=True)
+        # Already 16kHz mono int16: hand it back without any float round-trip
+        if sr == TARGET_SR and audio.shape[1] == 1:
+            return audio[:, 0], None
+        # Convert to mono (stays on the int16 scale as float32)
+        audio = audio.astype(np.float32)
+        audio = audio.mean(axis=1) if audio.shape[1] > 1 else audio[:, 0]
+        # Resample to 16kHz if needed
+        if sr != TARGET_SR:
+            up, down, taps = _resample_filter(sr)
+            audio = resample_poly(audio, up, down, window=taps)
+        # Filter ringing can overshoot full scale; clip before narrowing
+        np.clip(audio, -32768, 32767, out=audio)
+        return audio.astype(np.int16), None
+    except Exception as e:
+        return None, f"{os.path.basename(wav_path)}: {e}"
+
+
 def train_manual(samples_dir: Path):
     """Manual training when the openwakeword train module isn't available."""
-    import torch
-    import torch.nn as nn
-    import torchaudio
-    from openwakeword import Model as OWWModel
-
     print("\n--- Manual Training Pipeline ---")
 
     # Load the base feature extraction model
     oww = OWWModel()
 
     # Collect all positive WAV files
-    wav_files = sorted(samples_dir.rglob("*.wav"))
+    # String sort pins a deterministic base order; the seeded shuffle then
+    # mixes variants/voices instead of feeding them in directory order
+    rng = np.random.default_rng(TRAIN_SEED)
+    wav_files = sorted(_iter_wavs(str(samples_dir)))
+    rng.shuffle(wav_files)
     if not wav_files:
         print("  [ERROR] No WAV files found!")
         return None
@@ -145,38 +214,38 @@ def train_manual(samples_dir: Path):
     # Extract features from positive samples
     print("  Extracting features from positive samples...")
     positive_features = []
-    for i, wav_path in enumerate(wav_files):
-        if i % 100 == 0:
-            print(f"    Processing {i}/{len(wav_files)}...")
-        try:
-            waveform, sr = torchaudio.load(str(wav_path))
-            # Resample to 16kHz if needed
-            if sr != 16000:
-                resampler = torchaudio.transforms.Resample(sr, 16000)
-                waveform = resampler(waveform)
-            # Convert to mono
-            if waveform.shape[0] > 1:
-                waveform = waveform.mean(dim=0, keepdim=True)
-            # Get audio as int16 numpy
-            audio_np = (waveform.squeeze().numpy() * 32767).astype(np.int16)
-            # Feed through openWakeWord's feature pipeline
-            oww.predict(audio_np)
-            # The prediction runs the feature extraction; we'd need the intermediate features
-            # For now, store the raw audio for the full pipeline
-            positive_features.append(audio_np)
-        except Exception as e:
-            if i < 3:
-                print(f"    [WARN] Error processing {wav_path.name}: {e}")
+    errors = 0
+    # Decode + resample fans out across cores; oww.predict stays in this process
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = ex.map(_load_and_prep, wav_files, chunksize=DECODE_CHUNKSIZE)
+        for i, (audio_np, err) in enumerate(results):
+            if i % 100 == 0:
+                print(f"    Processing {i}/{len(wav_files)}...")
+            if audio_np is None:
+                if errors < 3:
+                    print(f"    [WARN] Error processing {err}")
+                errors += 1
+                continue
+            try:
+                # Feed through openWakeWord's feature pipeline
+                oww.predict(audio_np)
+                # The prediction runs the feature extraction; we'd need the intermediate features
+                # For now, store the raw audio for the full pipeline
+                positive_features.append(audio_np)
+            except Exception as e:
+                if errors < 3:
+                    print(f"    [WARN] Error processing {os.path.basename(wav_files[i])}: {e}")
+                errors += 1
 
     print(f"  Extracted features from {len(positive_features)} samples")
 
     # Generate negative samples (silence + noise)
     print("  Generating negative samples (silence + noise)...")
-    negative_features = []
-    for _ in range(len(positive_features)):
-        # Random noise at low level
-        noise = np.random.randn(16000).astype(np.float32) * 0.01
-        negative_features.append((noise * 32767).astype(np.int16))
+    # Random noise at low level, one (N, 16000) draw instead of N small ones
+    negative_features = (
+        rng.standard_normal((len(positive_features), TARGET_SR), dtype=np.float32)
+        * (0.01 * 32767)
+    ).astype(np.int16)
 
     print(f"  Generated {len(negative_features)} negative samples")
 
@@ -194,10 +263,10 @@ def train_manual(samples_dir: Path):
     # Save positive samples as a dataset for future Colab training
     dataset_dir = OUTPUT_DIR / "hey_joi_training_data"
     dataset_dir.mkdir(parents=True, exist_ok=True)
-    for i, audio in enumerate(positive_features[:100]):  # Save first 100 for inspection
-        import soundfile as sf
-        sf.write(str(dataset_dir / f"positive_{i:04d}.wav"), audio, 16000)
-    print(f"  Saved {min(100, len(positive_features))} sample WAVs to {dataset_dir}")
+    # Save first 100 as one compressed archive (16kHz int16, np.load in Colab)
+    samples = {f"positive_{i:04d}": audio for i, audio in enumerate(positive_features[:100])}
+    np.savez_compressed(str(dataset_dir / "positives.npz"), **samples)
+    print(f"  Saved {len(samples)} samples to {dataset_dir / 'positives.npz'}")
 
     return output_path
 